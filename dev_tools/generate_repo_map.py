@@ -26,14 +26,36 @@ SUPPORTED FILE TYPES:
 USAGE:
     python3 dev_tools/generate_repo_map.py
 
+    Optional: `pip install google-re2` to scan JS/TS files with the
+    linear-time re2 engine (the standard `re` module is used otherwise).
+
 OUTPUT:
     Creates/overwrites PROJECT_MAP.md in the project root directory.
 """
 
+import hashlib
+import json
+import mmap
 import os
 import re
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+# Optional linear-time regex engine (pip install google-re2); falls back to `re`.
+# re2 reads patterns and input as UTF-8 by default; Latin-1 mode makes it
+# match bytes one by one like `re` does with bytes patterns.
+try:
+    import re2 as dfa_re
+    DFA_OPTIONS = dfa_re.Options()
+    DFA_OPTIONS.encoding = dfa_re.Options.Encoding.LATIN1
+except ImportError:
+    dfa_re = re
+    DFA_OPTIONS = re.ASCII
 
 # =============================================================================
 # CONFIGURATION
@@ -66,6 +88,10 @@ IGNORE_EXTENSIONS = {
     '.lock',  # Lock files
 }
 
+# IGNORE_EXTENSIONS split by shape for fast lookups in should_ignore_file
+IGNORE_SIMPLE_EXTENSIONS = frozenset(ext for ext in IGNORE_EXTENSIONS if ext.count('.') == 1)
+IGNORE_COMPOUND_EXTENSIONS = tuple(sorted(ext for ext in IGNORE_EXTENSIONS if ext.count('.') > 1))
+
 # Specific filenames to ignore
 IGNORE_FILES = {
     'package-lock.json',
@@ -73,29 +99,57 @@ IGNORE_FILES = {
     'pnpm-lock.yaml',
     '.DS_Store',
     'Thumbs.db',
+    '.repo_map_cache.json',
+    '.repo_map_cache.json.tmp',
 }
 
-# Code file extensions that should be parsed for signatures
-CODE_EXTENSIONS = {'.py', '.ts', '.tsx', '.js', '.jsx', '.sh'}
+# Fewest files to scan before a process pool is worth its startup cost
+MIN_PARALLEL_FILES = 256
+
+# Threads reading code files for the in-process scan, and how many files
+# they may read ahead of it
+READ_WORKERS = 32
+READ_AHEAD = 64
+
+# Buffer size of the output file; the map is written straight to it
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Indentation strings for each tree depth, built once instead of per row
+INDENTS = tuple("  " * depth for depth in range(128))
+
+# Signature cache kept next to this script. Its version combines this
+# format number with a hash of the regex engine and signature patterns (see
+# CACHE_VERSION below); bump the number when signatures change otherwise
+CACHE_FILENAME = '.repo_map_cache.json'
+CACHE_FORMAT = 2
 
 # =============================================================================
 # SIGNATURE EXTRACTION PATTERNS
 # =============================================================================
 
-# Python patterns
-PY_CLASS_PATTERN = re.compile(r'^(\s*)(class\s+\w+[^:]*):')
-PY_FUNC_PATTERN = re.compile(r'^(\s*)((?:async\s+)?def\s+\w+\s*\([^)]*\)[^:]*):')
-PY_DECORATOR_PATTERN = re.compile(r'^(\s*)(@\w+(?:\.\w+)*(?:\([^)]*\))?)')
-
-# JavaScript/TypeScript patterns
-JS_CLASS_PATTERN = re.compile(r'^(\s*)((?:export\s+)?(?:default\s+)?class\s+\w+[^{]*)')
-JS_FUNC_PATTERN = re.compile(r'^(\s*)((?:export\s+)?(?:default\s+)?(?:async\s+)?function\s+\w+\s*\([^)]*\)[^{]*)')
-JS_ARROW_PATTERN = re.compile(r'^(\s*)((?:export\s+)?(?:const|let|var)\s+\w+\s*=\s*(?:async\s+)?\([^)]*\)\s*=>)')
-JS_ARROW_SIMPLE_PATTERN = re.compile(r'^(\s*)((?:export\s+)?(?:const|let|var)\s+\w+\s*=\s*(?:async\s+)?\w+\s*=>)')
-JS_METHOD_PATTERN = re.compile(r'^(\s*)((?:async\s+)?(?:get\s+|set\s+)?\w+\s*\([^)]*\)\s*\{)')
-JS_INTERFACE_PATTERN = re.compile(r'^(\s*)((?:export\s+)?interface\s+\w+[^{]*)')
-JS_TYPE_PATTERN = re.compile(r'^(\s*)((?:export\s+)?type\s+\w+\s*=)')
-JS_COMPONENT_PATTERN = re.compile(r'^(\s*)((?:export\s+)?(?:default\s+)?(?:const|function)\s+\w+.*(?:React\.FC|JSX\.Element|\:\s*FC))')
+# All signature patterns are bytes patterns run over the raw file contents.
+# Each match starts at a line start and consumes the rest of its line.
+# Only matched signatures get decoded.
+#
+# `\w` only covers ASCII word bytes, so names use `[\w\x80-\xff]` to also
+# accept the bytes of UTF-8 encoded identifiers.
+#
+# The Python and shell patterns are compiled by `re` with re.ASCII and
+# re.MULTILINE.
+#
+# The JS pattern is compiled by re2 when it is installed, otherwise by `re`.
+# It sets MULTILINE inline with `(?m)`. DFA_OPTIONS selects Latin-1 mode
+# under re2 and re.ASCII under `re`, so both engines match byte by byte.
+
+# Python pattern: decorators, classes and functions in a single alternation
+PY_COMBINED_PATTERN = re.compile(
+    rb'^(?P<indent>[^\S\n]*)(?:'
+    rb'(?P<dec>@[\w\x80-\xff]+(?:\.[\w\x80-\xff]+)*(?:\([^)\n]*\))?)'
+    rb'|(?P<cls>class[ \t]+[\w\x80-\xff]+[^:\n]*):'
+    rb'|(?P<fn>(?:async[ \t]+)?def[ \t]+[\w\x80-\xff]+[ \t]*\([^)\n]*\)[^:\n]*):'
+    rb')[^\n]*\n?',
+    re.ASCII | re.MULTILINE,
+)
 
 # Control flow keywords to EXCLUDE from signatures (these are NOT function definitions)
 CONTROL_FLOW_KEYWORDS = {
@@ -103,27 +157,48 @@ CONTROL_FLOW_KEYWORDS = {
     'return', 'throw', 'break', 'continue', 'do', 'with'
 }
 
-# Shell script patterns
-SH_FUNC_PATTERN = re.compile(r'^(\s*)(\w+\s*\(\)\s*\{)')
-SH_FUNC_KEYWORD_PATTERN = re.compile(r'^(\s*)(function\s+\w+)')
+# JavaScript/TypeScript pattern: lines starting with a control flow keyword
+# (any case) that is not part of a longer name match `skip` first so
+# "if (status) {" is never taken for a method. Interfaces, type aliases, classes, functions and arrow functions
+# share the `decl` group; class methods are kept apart because they are
+# formatted differently. Kept free of lookarounds and backreferences so it
+# compiles under re2 too.
+JS_COMBINED_PATTERN = dfa_re.compile(
+    rb'(?m)^(?P<indent>[^\S\n]*)(?:'
+    rb'(?P<skip>(?i:' + '|'.join(sorted(CONTROL_FLOW_KEYWORDS)).encode() + rb')(?:[^\w\x80-\xff\n]|$))'
+    rb'|(?P<decl>'
+    rb'(?:export[ \t]+)?interface[ \t]+[\w\x80-\xff]+[^{\n]*'
+    rb'|(?:export[ \t]+)?type[ \t]+[\w\x80-\xff]+[ \t]*='
+    rb'|(?:export[ \t]+)?(?:default[ \t]+)?class[ \t]+[\w\x80-\xff]+[^{\n]*'
+    rb'|(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function[ \t]+[\w\x80-\xff]+[ \t]*\([^)\n]*\)[^{\n]*'
+    rb'|(?:export[ \t]+)?(?:const|let|var)[ \t]+[\w\x80-\xff]+[ \t]*=[ \t]*(?:async[ \t]+)?(?:\([^)\n]*\)|[\w\x80-\xff]+)[ \t]*=>'
+    rb')'
+    rb'|(?P<method>(?:async[ \t]+)?(?:get[ \t]+|set[ \t]+)?[\w\x80-\xff]+[ \t]*\([^)\n]*\)[ \t]*\{)'
+    rb')[^\n]*\n?',
+    DFA_OPTIONS,
+)
+
+# Shell script pattern: "name() {" and "function name" definitions
+SH_COMBINED_PATTERN = re.compile(
+    rb'^(?P<indent>[^\S\n]*)'
+    rb'(?P<sig>[\w\x80-\xff]+[ \t]*\(\)[ \t]*\{|function[ \t]+[\w\x80-\xff]+)'
+    rb'[^\n]*\n?',
+    re.ASCII | re.MULTILINE,
+)
+
+# Cached signatures are only valid for the patterns and regex engine that
+# produced them
+CACHE_VERSION = f"{CACHE_FORMAT}-" + hashlib.sha1(b'\0'.join([
+    dfa_re.__name__.encode(),
+    PY_COMBINED_PATTERN.pattern,
+    JS_COMBINED_PATTERN.pattern,
+    SH_COMBINED_PATTERN.pattern,
+])).hexdigest()
 
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
 
-def should_ignore_dir(dirname: str) -> bool:
-    """
-    Check if a directory should be ignored during traversal.
-    
-    Args:
-        dirname: Name of the directory to check
-        
-    Returns:
-        True if the directory should be ignored, False otherwise
-    """
-    return dirname in IGNORE_DIRS or dirname.startswith('.')
-
-
 def should_ignore_file(filename: str) -> bool:
     """
     Check if a file should be ignored.
@@ -137,10 +212,13 @@ def should_ignore_file(filename: str) -> bool:
     if filename in IGNORE_FILES:
         return True
     
-    # Check for ignored extensions
-    for ext in IGNORE_EXTENSIONS:
-        if filename.endswith(ext):
-            return True
+    # Check for ignored extensions: one set lookup for the last suffix, one
+    # endswith call covering all compound suffixes
+    extension = get_file_extension(filename)
+    if extension in IGNORE_SIMPLE_EXTENSIONS:
+        return True
+    if extension and filename.lower().endswith(IGNORE_COMPOUND_EXTENSIONS):
+        return True
     
     # Check for minified files
     if '.min.' in filename:
@@ -157,278 +235,474 @@ def get_file_extension(filename: str) -> str:
         filename: Name of the file
         
     Returns:
-        The file extension including the dot (e.g., '.py')
+        The file extension including the dot (e.g., '.py'), lowercased
+    """
+    dot = filename.rfind('.')
+    return filename[dot:].lower() if dot >= 0 else ''
+
+
+def walk_tree(dirpath: str, depth: int = 0):
     """
-    return Path(filename).suffix.lower()
+    Walk a directory tree top-down with os.scandir, skipping ignored directories.
+    
+    Entry types come straight from the directory listing, so plain files and
+    directories cost no extra stat call. Symlinked directories are neither
+    listed nor followed (same as os.walk).
+    
+    Args:
+        dirpath: Directory to start from
+        depth: Depth of dirpath relative to the project root
+        
+    Yields:
+        (directory name, depth, sorted list of (filename, filepath)) tuples
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    files = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            # Hidden directories and IGNORE_DIRS are pruned (checked inline: hot path)
+            name = entry.name
+            if name[:1] != '.' and name not in IGNORE_DIRS:
+                subdirs.append((name, entry.path))
+        elif not (entry.is_symlink() and entry.is_dir()):
+            files.append((entry.name, entry.path))
+    
+    files.sort()
+    yield os.path.basename(dirpath), depth, files
+    
+    subdirs.sort()
+    for _, subdir_path in subdirs:
+        yield from walk_tree(subdir_path, depth + 1)
 
 
-def extract_python_signatures(filepath: str) -> list:
+def read_source(filepath: str) -> bytes:
     """
-    Extract class and function signatures from a Python file.
+    Read the raw bytes of a code file.
     
     Args:
-        filepath: Path to the Python file
+        filepath: Path to the code file
+        
+    Returns:
+        The file contents
+    """
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+def read_ahead(filepaths: list):
+    """
+    Read files on I/O threads, at most READ_AHEAD files ahead of the consumer.
+    
+    Args:
+        filepaths: Paths of the files to read, in the order they are needed
+        
+    Yields:
+        One future per path, in order, resolving to the file's bytes
+    """
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as io_pool:
+        reads = deque()
+        for filepath in filepaths:
+            reads.append(io_pool.submit(read_source, filepath))
+            if len(reads) > READ_AHEAD:
+                yield reads.popleft()
+        while reads:
+            yield reads.popleft()
+
+
+def format_read_error(error: Exception, extension: str) -> list:
+    """
+    Build the signature entry reported for a file that could not be read.
+    
+    Args:
+        error: The exception raised while reading
+        extension: File extension, used to pick the comment style
+        
+    Returns:
+        Single-item list with the error as a code comment
+    """
+    comment = '//' if extension in JS_EXTENSIONS else '#'
+    return [f"  {comment} Error reading file: {error}"]
+
+
+def extract_python_signatures(data: bytes) -> list:
+    """
+    Extract class and function signatures from Python source.
+    
+    Args:
+        data: Raw contents of the Python file (bytes or a memory map)
         
     Returns:
         List of signature strings with preserved indentation
     """
+    # Every signature contains one of these keywords; a plain byte search
+    # rules out definition-free files without running the regex at all
+    if data.find(b'def') < 0 and data.find(b'class') < 0:
+        return []
+    
     signatures = []
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+    append = signatures.append
+    
+    # Decorators are held back until the class/function on the line right
+    # after them is found; any other line in between discards them.
+    pending_decorators = []
+    pending_indent = None
+    pending_end = -1
+    for match in PY_COMBINED_PATTERN.finditer(data):
+        indent, decorator, class_sig, func_sig = match.groups()
+        adjacent = match.start() == pending_end
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            
-            # Check for decorators (capture them with the following function/class)
-            decorator_match = PY_DECORATOR_PATTERN.match(line)
-            if decorator_match:
-                decorators = [decorator_match.group(2)]
-                indent = decorator_match.group(1)
-                i += 1
-                # Collect all consecutive decorators
-                while i < len(lines):
-                    next_decorator = PY_DECORATOR_PATTERN.match(lines[i])
-                    if next_decorator and next_decorator.group(1) == indent:
-                        decorators.append(next_decorator.group(2))
-                        i += 1
-                    else:
-                        break
-                # Now check for the class/function
-                if i < len(lines):
-                    class_match = PY_CLASS_PATTERN.match(lines[i])
-                    func_match = PY_FUNC_PATTERN.match(lines[i])
-                    if class_match:
-                        for dec in decorators:
-                            signatures.append(f"{indent}{dec}")
-                        signatures.append(f"{class_match.group(1)}{class_match.group(2)}")
-                    elif func_match:
-                        for dec in decorators:
-                            signatures.append(f"{indent}{dec}")
-                        signatures.append(f"{func_match.group(1)}{func_match.group(2)}")
-                continue
-            
-            # Check for class definitions
-            class_match = PY_CLASS_PATTERN.match(line)
-            if class_match:
-                signatures.append(f"{class_match.group(1)}{class_match.group(2)}")
-                i += 1
-                continue
-            
-            # Check for function definitions
-            func_match = PY_FUNC_PATTERN.match(line)
-            if func_match:
-                signatures.append(f"{func_match.group(1)}{func_match.group(2)}")
-                i += 1
-                continue
-            
-            i += 1
-    except Exception as e:
-        signatures.append(f"  # Error reading file: {e}")
+        if decorator is not None:
+            # Collect consecutive decorators at the same indentation
+            if not adjacent or indent != pending_indent:
+                pending_decorators = []
+                pending_indent = indent
+            pending_decorators.append((indent + decorator).decode('utf-8', 'ignore'))
+            pending_end = match.end()
+            continue
+        
+        # Class or function definition
+        if adjacent:
+            signatures.extend(pending_decorators)
+        pending_decorators = []
+        pending_end = -1
+        append((indent + (class_sig or func_sig)).decode('utf-8', 'ignore'))
     
     return signatures
 
 
-def extract_js_signatures(filepath: str) -> list:
+def extract_js_signatures(data: bytes) -> list:
     """
-    Extract class, function, and component signatures from JavaScript/TypeScript files.
+    Extract class, function, and component signatures from JavaScript/TypeScript source.
     Explicitly EXCLUDES control flow statements (if, for, while, switch, etc.)
     
     Args:
-        filepath: Path to the JS/TS file
+        data: Raw contents of the JS/TS file (bytes or a memory map)
         
     Returns:
         List of signature strings with preserved indentation
     """
     signatures = []
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+    append = signatures.append
+    # Groups are unpacked positionally: re2 keys bytes-pattern group names by bytes
+    for match in JS_COMBINED_PATTERN.finditer(data):
+        indent, skip, declaration, method = match.groups()
         
-        for line in lines:
-            stripped = line.strip()
-            
-            # CRITICAL: Skip control flow statements - they are NOT signatures!
-            # This prevents matching "if (status) {" as a function
-            if stripped:
-                parts = stripped.split('(')[0].split()
-                first_word = parts[0] if parts else ''
-                if first_word.lower() in CONTROL_FLOW_KEYWORDS:
-                    continue
-            
-            # Check for interfaces (TypeScript)
-            interface_match = JS_INTERFACE_PATTERN.match(line)
-            if interface_match:
-                signatures.append(f"{interface_match.group(1)}{interface_match.group(2).strip()}")
-                continue
-            
-            # Check for type aliases (TypeScript)
-            type_match = JS_TYPE_PATTERN.match(line)
-            if type_match:
-                signatures.append(f"{type_match.group(1)}{type_match.group(2).strip()}")
-                continue
-            
-            # Check for class definitions
-            class_match = JS_CLASS_PATTERN.match(line)
-            if class_match:
-                signatures.append(f"{class_match.group(1)}{class_match.group(2).strip()}")
-                continue
-            
-            # Check for function declarations
-            func_match = JS_FUNC_PATTERN.match(line)
-            if func_match:
-                signatures.append(f"{func_match.group(1)}{func_match.group(2).strip()}")
-                continue
-            
-            # Check for arrow functions with parameters
-            arrow_match = JS_ARROW_PATTERN.match(line)
-            if arrow_match:
-                signatures.append(f"{arrow_match.group(1)}{arrow_match.group(2).strip()}")
-                continue
-            
-            # Check for simple arrow functions
-            arrow_simple_match = JS_ARROW_SIMPLE_PATTERN.match(line)
-            if arrow_simple_match:
-                signatures.append(f"{arrow_simple_match.group(1)}{arrow_simple_match.group(2).strip()}")
-                continue
-            
-            # Check for class methods (only at indentation level > 0)
-            method_match = JS_METHOD_PATTERN.match(line)
-            if method_match and len(method_match.group(1)) > 0:
-                # Clean up the method signature
-                sig = method_match.group(2).rstrip('{').strip()
-                signatures.append(f"{method_match.group(1)}{sig}()")
-                continue
-    except Exception as e:
-        signatures.append(f"  // Error reading file: {e}")
+        if declaration is not None:
+            append(indent.decode('ascii') + declaration.decode('utf-8', 'ignore').strip())
+            continue
+        
+        # CRITICAL: Skip control flow statements - they are NOT signatures!
+        # Class methods only count at indentation level > 0
+        if skip is not None or not indent:
+            continue
+        
+        # Clean up the method signature
+        sig = method.decode('utf-8', 'ignore').rstrip('{').strip()
+        append(f"{indent.decode('ascii')}{sig}()")
     
     return signatures
 
 
-def extract_shell_signatures(filepath: str) -> list:
+def extract_shell_signatures(data: bytes) -> list:
     """
-    Extract function definitions from shell scripts.
+    Extract function definitions from shell script source.
     
     Args:
-        filepath: Path to the shell script file
+        data: Raw contents of the shell script (bytes or a memory map)
         
     Returns:
         List of signature strings with preserved indentation
     """
+    if data.find(b'()') < 0 and data.find(b'function') < 0:
+        return []
+    
     signatures = []
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            # Check for function_name() { style
-            func_match = SH_FUNC_PATTERN.match(line)
-            if func_match:
-                signatures.append(f"{func_match.group(1)}{func_match.group(2)}")
-                continue
-            
-            # Check for "function name" style
-            func_keyword_match = SH_FUNC_KEYWORD_PATTERN.match(line)
-            if func_keyword_match:
-                signatures.append(f"{func_keyword_match.group(1)}{func_keyword_match.group(2)}")
-                continue
-    except Exception as e:
-        signatures.append(f"  # Error reading file: {e}")
+    append = signatures.append
+    for match in SH_COMBINED_PATTERN.finditer(data):
+        indent, sig = match.groups()
+        append((indent + sig).decode('utf-8', 'ignore'))
     
     return signatures
 
 
-def extract_signatures(filepath: str, extension: str) -> list:
+# Extractor for each code extension, resolved once per file by a dict lookup
+EXTRACTORS = {
+    '.py': extract_python_signatures,
+    '.js': extract_js_signatures,
+    '.jsx': extract_js_signatures,
+    '.ts': extract_js_signatures,
+    '.tsx': extract_js_signatures,
+    '.sh': extract_shell_signatures,
+}
+
+# Code file extensions that should be parsed for signatures
+CODE_EXTENSIONS = frozenset(EXTRACTORS)
+
+# Code file extensions parsed with the JavaScript/TypeScript patterns
+JS_EXTENSIONS = frozenset(
+    extension for extension, extractor in EXTRACTORS.items()
+    if extractor is extract_js_signatures
+)
+
+
+def extract_signatures(filepath: str, extension: str) -> tuple:
     """
     Extract signatures from a code file based on its extension.
     
+    The file is memory-mapped and scanned in place, so no copy of its
+    contents is made; pages are loaded by the kernel on demand.
+    
     Args:
         filepath: Path to the code file
+        extension: File extension, one of CODE_EXTENSIONS (e.g., '.py')
+        
+    Returns:
+        (signatures, readable) - the list of signature strings, and False
+        when the file could not be read and the list holds the error instead
+    """
+    extractor = EXTRACTORS[extension]
+    try:
+        with open(filepath, 'rb') as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return [], True
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return extractor(data), True
+    except Exception as e:
+        return format_read_error(e, extension), False
+
+
+def extract_read_signatures(read, extension: str) -> tuple:
+    """
+    Extract signatures from a code file read ahead on an I/O thread.
+    
+    Args:
+        read: Future resolving to the file's bytes (see read_ahead)
         extension: File extension (e.g., '.py')
         
     Returns:
-        List of signature strings
+        (signatures, readable), as for extract_signatures
     """
-    if extension == '.py':
-        return extract_python_signatures(filepath)
-    elif extension in {'.js', '.jsx', '.ts', '.tsx'}:
-        return extract_js_signatures(filepath)
-    elif extension == '.sh':
-        return extract_shell_signatures(filepath)
-    return []
+    try:
+        return EXTRACTORS[extension](read.result()), True
+    except Exception as e:
+        return format_read_error(e, extension), False
 
 
-def generate_project_map(root_dir: str) -> str:
+def load_signature_cache(cache_path: str) -> dict:
+    """
+    Load cached signatures from a previous run.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        
+    Returns:
+        Mapping of file path -> {"mtime": int, "size": int, "sigs": [...]},
+        empty if the cache is missing, unreadable or from another version;
+        malformed entries are left out
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    files = cache.get('files')
+    if not isinstance(files, dict):
+        return {}
+    return {
+        path: entry for path, entry in files.items()
+        if isinstance(entry, dict) and isinstance(entry.get('sigs'), list)
+    }
+
+
+def save_signature_cache(cache_path: str, files: dict):
     """
-    Generate the complete project map as a string.
+    Write the signature cache, replacing the previous file atomically.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        files: Mapping of file path -> cache entry (see load_signature_cache)
+    """
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️  Could not write signature cache: {e}")
+        # Do not leave a partial file behind for the next map to list
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def generate_project_map(root_dir: str, out, cache_path: Optional[str] = None) -> int:
+    """
+    Generate the complete project map and write it to an open text file.
+    
+    Lines are written to the file as they are rendered instead of being
+    joined into one string first; batching the writes is left to the
+    file's own buffer.
+    
+    When a cache path is given, files whose mtime and size are unchanged
+    since the previous run reuse their cached signatures instead of being
+    parsed again.
     
     Args:
         root_dir: Root directory of the project
+        out: Writable text file for the markdown (ideally with a large buffer)
+        cache_path: Optional path of the signature cache file
         
     Returns:
-        The complete project map as a markdown string
+        Number of lines written
     """
-    lines = []
     root_path = Path(root_dir)
     project_name = root_path.name
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    # Header
-    lines.append(f"# 🗺️ PROJECT MAP: {project_name}")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
-    lines.append("> **Note:** This map shows the project structure and code signatures (classes, functions, methods).")
-    lines.append("> Run `python3 dev_tools/generate_repo_map.py` to regenerate after significant changes.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Walk the directory tree
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Filter out ignored directories (modify in place to prevent descending)
-        dirnames[:] = [d for d in dirnames if not should_ignore_dir(d)]
-        dirnames.sort()
-        
-        # Calculate relative path and depth
-        rel_path = Path(dirpath).relative_to(root_path)
-        depth = len(rel_path.parts)
+    # Phase 1: walk the tree into parallel arrays, one entry per directory
+    # and one per file; directory i owns files dir_file_starts[i]..[i + 1]
+    dir_names = []
+    dir_depths = array('i')
+    dir_file_starts = array('i')
+    file_names = []
+    file_paths = []
+    for dirname, depth, entries in walk_tree(root_dir):
+        dir_names.append(dirname)
+        dir_depths.append(depth)
+        dir_file_starts.append(len(file_names))
+        for filename, filepath in entries:
+            file_names.append(filename)
+            file_paths.append(filepath)
+    dir_file_starts.append(len(file_names))
+    
+    # Phase 2: mask out ignored files and classify the rest by extension
+    keep = [not should_ignore_file(filename) for filename in file_names]
+    file_extensions = [
+        get_file_extension(filename) if kept else ''
+        for filename, kept in zip(file_names, keep)
+    ]
+    code_indices = [i for i, extension in enumerate(file_extensions) if extension in CODE_EXTENSIONS]
+    
+    # Phase 3: signatures per file index (None for non-code files). With a
+    # cache, signatures are reused for files unchanged since the last run;
+    # only files seen in this run are carried over, dropping deleted ones.
+    # Without one, no file is stat'ed and every code file is scanned.
+    file_signatures = [None] * len(file_names)
+    fresh_cache = {}
+    stamps = {}
+    if cache_path:
+        cache = load_signature_cache(cache_path)
+        pending = []
+        for i in code_indices:
+            path = file_paths[i]
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            else:
+                stamps[i] = (st.st_mtime_ns, st.st_size)
+                cached = cache.get(path)
+                if cached and cached.get('mtime') == st.st_mtime_ns and cached.get('size') == st.st_size:
+                    file_signatures[i] = cached['sigs']
+                    fresh_cache[path] = cached
+                    continue
+            pending.append(i)
+    else:
+        pending = code_indices
+    
+    # The remaining code files are scanned in a process pool when there are
+    # enough of them and more than one CPU. Each worker maps and reads its
+    # own files, so only paths go out and signature lists come back. Files
+    # the pool did not finish (or all of them, for small runs) are scanned
+    # here while I/O threads read ahead; those threads only start once the
+    # pool is shut down, so no worker is ever forked from a threaded process.
+    # Unreadable files report an error and are not cached.
+    if pending:
+        pending_paths = [file_paths[i] for i in pending]
+        pending_extensions = [file_extensions[i] for i in pending]
+        results = []
+        if len(pending) >= MIN_PARALLEL_FILES and (os.cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor() as cpu_pool:
+                    for result in cpu_pool.map(extract_signatures, pending_paths, pending_extensions, chunksize=32):
+                        results.append(result)
+            except BrokenProcessPool as e:
+                print(f"⚠️  Parallel scan failed, continuing in-process: {e}")
+        done = len(results)
+        if done < len(pending):
+            reads = read_ahead(pending_paths[done:])
+            results.extend(map(extract_read_signatures, reads, pending_extensions[done:]))
         
-        # Add directory header
+        for i, (signatures, readable) in zip(pending, results):
+            file_signatures[i] = signatures
+            if readable and i in stamps:
+                mtime, size = stamps[i]
+                fresh_cache[file_paths[i]] = {'mtime': mtime, 'size': size, 'sigs': signatures}
+    
+    if cache_path:
+        save_signature_cache(cache_path, fresh_cache)
+    
+    # Phase 4: render directories and files in tree order
+    write = out.write
+    line_count = 0
+    
+    def write_line(line: str):
+        nonlocal line_count
+        write(line)
+        write("\n")
+        line_count += 1
+    
+    # Header
+    write_line(f"# 🗺️ PROJECT MAP: {project_name}")
+    write_line("")
+    write_line(f"**Generated:** {generated_at}")
+    write_line("")
+    write_line("> **Note:** This map shows the project structure and code signatures (classes, functions, methods).")
+    write_line("> Run `python3 dev_tools/generate_repo_map.py` to regenerate after significant changes.")
+    write_line("")
+    write_line("---")
+    
+    for d, depth in enumerate(dir_depths):
+        # Blank line, then the directory header
+        write_line("")
+        file_indent = INDENTS[depth] if depth < len(INDENTS) else "  " * depth
         if depth == 0:
-            lines.append(f"## 📁 / (root)")
+            write_line(f"## 📁 / (root)")
         else:
-            indent = "  " * (depth - 1)
-            lines.append(f"{indent}### 📁 {rel_path.name}/")
+            write_line(f"{file_indent[2:]}### 📁 {dir_names[d]}/")
         
-        # Process files in this directory
-        filenames.sort()
-        for filename in filenames:
-            if should_ignore_file(filename):
+        for i in range(dir_file_starts[d], dir_file_starts[d + 1]):
+            if not keep[i]:
                 continue
             
-            filepath = os.path.join(dirpath, filename)
-            extension = get_file_extension(filename)
-            file_indent = "  " * depth
-            
-            # Check if it's a code file that should be parsed
-            if extension in CODE_EXTENSIONS:
-                lines.append(f"{file_indent}#### 📄 {filename}")
-                signatures = extract_signatures(filepath, extension)
+            filename = file_names[i]
+            signatures = file_signatures[i]
+            # Check if it's a code file that was parsed
+            if signatures is not None:
+                write_line(f"{file_indent}#### 📄 {filename}")
                 if signatures:
-                    lines.append(f"{file_indent}```")
-                    for sig in signatures:
-                        lines.append(f"{file_indent}{sig}")
-                    lines.append(f"{file_indent}```")
+                    # Whole signature block in a single write
+                    write_line(f"{file_indent}```")
+                    write("".join([f"{file_indent}{sig}\n" for sig in signatures]))
+                    line_count += len(signatures)
+                    write_line(f"{file_indent}```")
                 else:
-                    lines.append(f"{file_indent}*(no signatures found)*")
+                    write_line(f"{file_indent}*(no signatures found)*")
             else:
                 # Just list non-code files
-                lines.append(f"{file_indent}- 📄 {filename}")
-        
-        lines.append("")
+                write_line(f"{file_indent}- 📄 {filename}")
     
-    return "\n".join(lines)
+    return line_count
 
 
 def main():
@@ -443,16 +717,14 @@ def main():
     print(f"📁 Ignoring directories: {', '.join(sorted(IGNORE_DIRS))}")
     print()
     
-    # Generate the map
-    project_map = generate_project_map(str(project_root))
-    
-    # Write to file
+    # Generate the map straight into the output file
     output_path = project_root / "PROJECT_MAP.md"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(project_map)
+    cache_path = script_dir / CACHE_FILENAME
+    with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        line_count = generate_project_map(str(project_root), f, str(cache_path))
     
     print(f"✅ Project map written to: {output_path}")
-    print(f"📊 Total lines: {len(project_map.splitlines())}")
+    print(f"📊 Total lines: {line_count}")
 
 
 if __name__ == "__main__":